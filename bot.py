@@ -1,29 +1,121 @@
 import os
+import asyncio
+import functools
 import logging
 import sqlite3
-import uuid
+import threading
+import itertools
+import hashlib
 import re
 import io
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
 from dateutil.parser import parse as date_parse
 
+# Optional: dateparser handles phrases like "next Monday" natively and scores
+# better than dateutil's fuzzy mode; used for the fallback stage when present.
+try:
+    from dateparser import parse as dateparser_parse
+except ImportError:
+    dateparser_parse = None
+
+_DATEPARSER_SETTINGS = {'PREFER_DATES_FROM': 'future', 'RETURN_AS_TIMEZONE_AWARE': False}
+
 from telegram import (
-    Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup
+    Update, InlineKeyboardButton, InlineKeyboardMarkup, MessageEntity,
+    ReplyKeyboardMarkup
 )
 from telegram.ext import (
     Application, CommandHandler, MessageHandler, ConversationHandler,
     ContextTypes, filters, CallbackQueryHandler, JobQueue, ChatMemberHandler
 )
+from apscheduler.jobstores.base import JobLookupError
 
-# OCR dependencies
-try:
-    from PIL import Image
-    import pytesseract
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+# OCR dependencies are imported lazily: PIL + pytesseract cost a few hundred ms
+# at cold start, which matters on platforms like Railway, and many users never
+# send a photo at all.
+_ocr = None
+def _get_ocr():
+    """Returns (Image, pytesseract) on first photo, False if OCR deps missing."""
+    global _ocr
+    if _ocr is None:
+        try:
+            from PIL import Image
+            import pytesseract
+            _ocr = (Image, pytesseract)
+        except ImportError:
+            _ocr = False
+    return _ocr
+
+_TESS_CONFIG = '--oem 1 --psm 6'  # LSTM engine, single uniform block of text
+
+def _preprocess_for_ocr(img, Image):
+    """Grayscale, downscale and boost contrast before Tesseract.
+
+    Tesseract's runtime scales with pixel count and its accuracy drops on
+    low-contrast phone screenshots — exactly the payload this bot receives.
+    Hard binarisation is left to Tesseract's own Otsu pass."""
+    from PIL import ImageOps
+    img = img.convert('L')
+    w, h = img.size
+    if max(w, h) > 1600:
+        img.thumbnail((1600, 1600), Image.LANCZOS)
+    elif min(w, h) < 1000:
+        # Telegram thumbnails small photos aggressively; Tesseract needs
+        # roughly 300 DPI-equivalent glyphs to avoid empty output.
+        img = img.resize((w * 2, h * 2), Image.LANCZOS)
+    return ImageOps.autocontrast(img)
+
+_OCR_MIN_CONF = 60
+
+def _ocr_extract_text(pytesseract, img):
+    """OCR via image_to_data, dropping words Tesseract is unsure about.
+
+    image_to_string costs the same but returns every hallucinated token,
+    which the auto-detect regexes then chew on. Filtering on per-word
+    confidence keeps the noise out; lines are rebuilt from the block/
+    paragraph/line numbers so first-line title detection still works."""
+    data = pytesseract.image_to_data(
+        img, output_type=pytesseract.Output.DICT, config=_TESS_CONFIG
+    )
+    lines = {}
+    for word, conf, key in zip(data['text'], data['conf'],
+                               zip(data['block_num'], data['par_num'], data['line_num'])):
+        if word.strip() and int(float(conf)) >= _OCR_MIN_CONF:
+            lines.setdefault(key, []).append(word)
+    return '\n'.join(' '.join(words) for words in lines.values())
+
+# Cap concurrent tesseract runs at the core count so a burst of photos
+# doesn't spawn more OCR processes than the machine can service.
+_OCR_SEM = asyncio.Semaphore(os.cpu_count() or 1)
+
+# OCR results keyed by image content hash: the same poster forwarded from
+# several groups costs a ~1ms blake2b instead of a full Tesseract run.
+_OCR_CACHE = OrderedDict()
+_OCR_CACHE_MAX = 512
+_OCR_CACHE_LOCK = threading.Lock()
+
+def _sync_ocr(ocr, buf):
+    """Decode + preprocess + OCR one image from a BytesIO; runs in a worker
+    thread. getbuffer() gives the hash a zero-copy view of the bytes."""
+    key = hashlib.blake2b(buf.getbuffer(), digest_size=16).digest()
+    with _OCR_CACHE_LOCK:
+        cached = _OCR_CACHE.get(key)
+        if cached is not None:
+            _OCR_CACHE.move_to_end(key)
+            return cached
+    Image, pytesseract = ocr
+    buf.seek(0)
+    img = _preprocess_for_ocr(Image.open(buf), Image)
+    text = _ocr_extract_text(pytesseract, img)
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE[key] = text
+        if len(_OCR_CACHE) > _OCR_CACHE_MAX:
+            _OCR_CACHE.popitem(last=False)
+    return text
 
 # Load environment
 if os.path.exists(".env"):
@@ -39,11 +131,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# DB setup
+# DB setup — one long-lived connection for the bot's lifetime. Opening a fresh
+# connection per handler re-reads the database header and starts with a cold
+# page cache on every command. check_same_thread=False because check_missed's
+# helpers run in worker threads; DB_LOCK serialises all access.
 DB_FILE = 'opportunities.db'
+DB_CONN = None
+DB_LOCK = threading.Lock()
+_OPP_SEQ = None
+
+def _next_opp_id():
+    """Short monotonically increasing hex id. Replaces str(uuid4())[:8]: no
+    urandom syscall per save and no birthday-collision odds as the table
+    grows. The last issued value is persisted in meta so a restart never
+    hands a deleted row's id to a new opportunity (stale Mark-as-Done
+    buttons carry old ids). Called under DB_LOCK inside the insert
+    transaction, so the high-water mark commits with the row. A legacy
+    uuid-prefix id could in principle equal a counter value, so the insert
+    retries on IntegrityError."""
+    n = next(_OPP_SEQ)
+    DB_CONN.execute("UPDATE meta SET value = ? WHERE key = 'opp_seq'", (n,))
+    return format(n, 'x')
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
+    global DB_CONN, _OPP_SEQ
+    DB_CONN = sqlite3.connect(DB_FILE, check_same_thread=False, cached_statements=256)
+    DB_CONN.row_factory = sqlite3.Row  # C-level named access, no per-row unpacking
+    c = DB_CONN.cursor()
+    # WAL lets the daily sweep read while a save commits, and NORMAL sync
+    # drops the two-fsync-per-commit cost of the default rollback journal.
+    c.execute('PRAGMA journal_mode=WAL')
+    c.execute('PRAGMA synchronous=NORMAL')
+    c.execute('PRAGMA temp_store=MEMORY')
+    c.execute('PRAGMA mmap_size=268435456')
+    c.execute('PRAGMA cache_size=-20000')
+    c.execute('PRAGMA busy_timeout=5000')
     c.execute('''
         CREATE TABLE IF NOT EXISTS opportunities (
             opp_id TEXT PRIMARY KEY,
@@ -51,6 +173,7 @@ def init_db():
             title TEXT,
             opp_type TEXT,
             deadline TEXT,
+            deadline_ts INTEGER,
             priority TEXT,
             description TEXT,
             message_text TEXT,
@@ -61,15 +184,50 @@ def init_db():
         )
     ''')
     # Safe migration for existing databases
-    for col, defn in [("link", "TEXT"), ("missed_notified", "INTEGER DEFAULT 0")]:
+    for col, defn in [("link", "TEXT"), ("missed_notified", "INTEGER DEFAULT 0"),
+                      ("deadline_ts", "INTEGER")]:
         try:
             c.execute(f"ALTER TABLE opportunities ADD COLUMN {col} {defn}")
         except sqlite3.OperationalError:
             pass
-    conn.commit()
-    conn.close()
+    # Backfill deadline_ts from the ISO strings written by older versions.
+    # Parsed in Python because deadlines were saved as naive local time.
+    c.execute('SELECT opp_id, deadline FROM opportunities WHERE deadline_ts IS NULL AND deadline IS NOT NULL')
+    backfill = []
+    for opp_id, dl_str in c.fetchall():
+        try:
+            backfill.append((int(datetime.fromisoformat(dl_str).timestamp()), opp_id))
+        except ValueError:
+            pass
+    if backfill:
+        c.executemany('UPDATE opportunities SET deadline_ts = ? WHERE opp_id = ?', backfill)
+    # Composite indexes matching the hot WHERE clauses: /list and /summary
+    # filter per-user, check_missed sweeps by deadline across all users. The
+    # old single-column deadline_ts index is subsumed by idx_opps_missed.
+    c.execute('DROP INDEX IF EXISTS idx_deadline_ts')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_opps_user_active ON opportunities(user_id, archived, done, deadline_ts)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_opps_missed ON opportunities(deadline_ts, archived, done, missed_notified)')
+    c.execute('ANALYZE')
+    # Seed the short-id sequence from the persisted high-water mark, not just
+    # the surviving rows: MAX(rowid) alone re-issues a deleted row's id after
+    # a restart. MAX(rowid) still backstops databases from before meta existed.
+    c.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)')
+    c.execute("INSERT OR IGNORE INTO meta(key, value) VALUES ('opp_seq', 0)")
+    c.execute("SELECT value FROM meta WHERE key = 'opp_seq'")
+    stored = c.fetchone()[0]
+    c.execute('SELECT COALESCE(MAX(rowid), 0) FROM opportunities')
+    _OPP_SEQ = itertools.count(max(stored, c.fetchone()[0]) + 1)
+    DB_CONN.commit()
 init_db()
 
+# Hoisted so every save runs the byte-identical SQL string and hits the
+# connection's prepared-statement cache instead of re-parsing the plan.
+_INSERT_SQL = (
+    'INSERT INTO opportunities '
+    '(opp_id, user_id, title, opp_type, deadline, deadline_ts, priority, description, message_text, link) '
+    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'
+)
+
 # Conversation states
 DEADLINE, TYPE, PRIORITY, TITLE, DESCRIPTION, LINK, CONFIRM = range(7)
 
@@ -88,9 +246,76 @@ INTRO_TEXT = (
     "🚀 Forward a message or type opportunity details now!"
 )
 
+def _precompute_bold_entities(markdown_text):
+    """Strip *bold* markers from a static template and return (plain_text,
+    entities) so the intro can be sent without parse_mode — Telegram then
+    skips re-parsing the same constant markdown on every /start. Offsets and
+    lengths are in UTF-16 code units, as the Bot API requires."""
+    plain_parts = []
+    entities = []
+    utf16_len = 0
+    for i, chunk in enumerate(markdown_text.split('*')):
+        chunk_units = len(chunk.encode('utf-16-le')) // 2
+        if i % 2:  # inside a *...* span
+            entities.append(MessageEntity(MessageEntity.BOLD, offset=utf16_len, length=chunk_units))
+        plain_parts.append(chunk)
+        utf16_len += chunk_units
+    return ''.join(plain_parts), tuple(entities)
+
+INTRO_TEXT_PLAIN, INTRO_ENTITIES = _precompute_bold_entities(INTRO_TEXT)
+
 # --- Auto-parse helpers ---
+# All date formats fused into one compiled alternation so a message is scanned
+# once instead of once per format. Named groups tell us which branch hit: the
+# "deadline:" form needs its inner capture, the rest use the whole match.
+_DATE_RE = re.compile(
+    r'(?P<mon>\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s*\d{4})?\b)'
+    r'|(?P<mdy>\b\d{1,2}/\d{1,2}/\d{2,4}\b)'
+    r'|(?P<iso>\b\d{4}-\d{2}-\d{2}\b)'
+    r'|deadline\s*[:\-]?\s*(?P<after_kw>\w+\s+\d{1,2}(?:,\s*\d{4})?)',
+    re.IGNORECASE,
+)
+
+# Formats tried with C-level strptime before falling back to dateutil's fuzzy
+# parser, which costs orders of magnitude more than these common shapes.
+# Only shapes with an explicit year go here: their result never depends on
+# "now", so it is safe to memoize. Year-less and relative phrases ("Feb 20",
+# "next Monday", "tomorrow") are handled uncached in try_parse_date.
+_FAST_DATE_FORMATS = ('%Y-%m-%d %H:%M', '%b %d %Y', '%b %d, %Y', '%d %b %Y', '%m/%d/%Y')
+_YEARLESS_FORMATS = ('%b %d',)
+
+@functools.lru_cache(maxsize=1024)
+def _cached_exact_parse(text):
+    """Memoized parse of deterministic formats only: fromisoformat, then
+    strptime shapes with an explicit year. Users forward the same deadlines
+    copied between posts again and again, so hits are a dict lookup."""
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
 def try_parse_date(text):
+    text = text.strip()
+    parsed = _cached_exact_parse(text)
+    if parsed is not None:
+        return parsed
+    # Everything past here depends on the current date, so no memoization:
+    # a cached "next Monday" would be served stale to every later user.
+    for fmt in _YEARLESS_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).replace(year=datetime.now().year)
+        except ValueError:
+            continue
     try:
+        if dateparser_parse is not None:
+            # Cap input length: dateparser cost grows with the string.
+            return dateparser_parse(text[:1000], settings=_DATEPARSER_SETTINGS)
         return date_parse(text, fuzzy=True)
     except Exception:
         return None
@@ -98,55 +323,99 @@ def try_parse_date(text):
 def auto_detect_date(text):
     if not text:
         return None
-    date_patterns = [
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s*\d{4})?\b',
-        r'\b\d{1,2}/\d{1,2}/\d{2,4}\b',
-        r'\b\d{4}-\d{2}-\d{2}\b',
-        r'(?i)deadline\s*[:\-]?\s*(\w+\s+\d{1,2}(?:,\s*\d{4})?)',
-    ]
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            parsed = try_parse_date(match.group(0) or match.group(1))
-            if parsed:
-                return parsed
+    match = _DATE_RE.search(text)
+    if match:
+        raw = match.group('after_kw') if match.lastgroup == 'after_kw' else match.group(0)
+        parsed = try_parse_date(raw)
+        if parsed:
+            return parsed
     return try_parse_date(text)
 
-def auto_detect_title(text):
-    lines = text.splitlines()
-    for line in lines:
-        if line.lower().startswith("title:"):
-            return line.split(":", 1)[1].strip()[:100]
+_TITLE_RE = re.compile(r'^\s*title\s*:\s*(.+)$', re.IGNORECASE | re.MULTILINE)
+
+def auto_detect_title(text, lines):
+    """One compiled multiline search for a \"Title:\" line, falling back to
+    the first non-empty line (pre-stripped list from auto_detect_all)."""
+    m = _TITLE_RE.search(text)
+    if m:
+        return m.group(1).strip()[:100]
     if lines:
-        return lines[0].strip()[:100]
+        return lines[0][:100]
     return "Untitled Opportunity"
 
+_TYPE_RE = re.compile(
+    r'\b(internship|scholarship|event|conference|workshop|seminar|job|hiring|vacancy)\b',
+    re.IGNORECASE,
+)
+_TYPE_MAP = {
+    'internship': 'Internship',
+    'scholarship': 'Scholarship',
+    'event': 'Event',
+    'conference': 'Event',
+    'workshop': 'Event',
+    'seminar': 'Event',
+    'job': 'Job',
+    'hiring': 'Job',
+    'vacancy': 'Job',
+}
+
 def auto_detect_type(text):
-    text_lower = text.lower()
-    if "internship" in text_lower:
-        return "Internship"
-    elif "scholarship" in text_lower:
-        return "Scholarship"
-    elif "event" in text_lower or "conference" in text_lower:
-        return "Event"
-    elif "job" in text_lower:
-        return "Job"
-    return "Other"
-
-def auto_detect_description(text):
-    lines = text.splitlines()
-    if len(lines) > 1:
-        return "\n".join(lines[1:]).strip()[:500]  # type: ignore[index]
-    return text.strip()[:500]  # type: ignore[index]
+    m = _TYPE_RE.search(text)
+    return _TYPE_MAP[m.group(1).lower()] if m else "Other"
+
+def auto_detect_desc_range(text):
+    """(start, end) slice of the auto-detected description within text.
+
+    Storing offsets instead of a string copy keeps user_data from holding a
+    second full copy of a large OCR'd message for the whole conversation."""
+    nl = text.find('\n')
+    if nl != -1:
+        start = nl + 1
+        while start < len(text) and text[start] in ' \t\r\n':
+            start += 1
+    else:
+        start = 0
+    return start, min(start + 500, len(text))
+
+def resolve_auto_desc(user_data):
+    """Materialise the auto-detected description string on demand."""
+    start, end = user_data.get('auto_desc_range', (0, 0))
+    return user_data.get('message_text', '')[start:end].strip()
+
+def _truncate(s, n):
+    """Cap s at n chars with an ellipsis — shared by every preview builder."""
+    return s if len(s) <= n else s[:n] + '…'
+
+_URL_RE = re.compile(r'https?://\S+')
 
 def auto_detect_link(text):
     """Return the first URL found in text, or None."""
-    m = re.search(r'https?://\S+', text or '')
+    m = _URL_RE.search(text or '')
     return m.group(0).rstrip('.,)>') if m else None
 
+@dataclass
+class AutoDetected:
+    deadline: object
+    title: str
+    opp_type: str
+    desc_range: tuple
+    link: object
+
+def auto_detect_all(text):
+    """Run every auto-detector in one pass: the stripped non-empty line list
+    is computed once and shared, which matters for multi-KB OCR'd messages."""
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+    return AutoDetected(
+        deadline=auto_detect_date(text),
+        title=auto_detect_title(text, lines),
+        opp_type=auto_detect_type(text),
+        desc_range=auto_detect_desc_range(text),
+        link=auto_detect_link(text),
+    )
+
 # --- Handlers ---
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    await update.message.reply_text(INTRO_TEXT, parse_mode='Markdown')
+    await update.message.reply_text(INTRO_TEXT_PLAIN, entities=INTRO_ENTITIES)
 
 async def new_member_intro(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Fires the moment a user opens a chat with the bot (before /start)."""
@@ -154,7 +423,7 @@ async def new_member_intro(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if status in ('member', 'administrator'):
         uid = update.my_chat_member.from_user.id
         try:
-            await context.bot.send_message(chat_id=uid, text=INTRO_TEXT, parse_mode='Markdown')
+            await context.bot.send_message(chat_id=uid, text=INTRO_TEXT_PLAIN, entities=INTRO_ENTITIES)
         except Exception as exc:
             logger.warning('Could not send intro to %s: %s', uid, exc)
 
@@ -171,21 +440,30 @@ async def handle_forward(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     # OCR for photos
     if message.photo:
-        if OCR_AVAILABLE:
+        cap = message.caption or ""
+        # A substantial caption that already contains a date has everything
+        # the auto-detectors need; OCR is the most expensive step, skip it.
+        if len(cap) >= 40 and _DATE_RE.search(cap):
+            text = cap
+            ocr = None
+        else:
+            ocr = _get_ocr()
+        if ocr:
             photo = message.photo[-1]
             file = await photo.get_file()
-            byte_array = await file.download_as_bytearray()
+            buf = io.BytesIO()
+            await file.download_to_memory(out=buf)
             try:
-                img = Image.open(io.BytesIO(byte_array))
-                ocr_text = pytesseract.image_to_string(img)
+                async with _OCR_SEM:
+                    ocr_text = await asyncio.to_thread(_sync_ocr, ocr, buf)
                 text = ocr_text.strip() or "Image-based opportunity (no text extracted)"
                 if message.caption:
                     text = message.caption + "\n" + text
             except Exception as e:
                 logger.error(f"OCR failed: {e}")
-                text = message.caption or "No text extracted"
-        else:
-            text = message.caption or "No text extracted"
+                text = cap or "No text extracted"
+        elif not text:
+            text = cap or "No text extracted"
 
     if not text or text.strip() == "No text extracted":
         await message.reply_text("No text or image content detected. Please send a message with details.")
@@ -193,17 +471,14 @@ async def handle_forward(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     context.user_data['message_text'] = text
 
-    # Auto-detect all fields
-    auto_dl   = auto_detect_date(text)
-    auto_title = auto_detect_title(text)
-    auto_type  = auto_detect_type(text)
-    auto_desc  = auto_detect_description(text)
-    auto_link  = auto_detect_link(text)
+    # Auto-detect all fields in a single pass over the text
+    auto = auto_detect_all(text)
+    auto_dl = auto.deadline
 
-    context.user_data['auto_title'] = auto_title
-    context.user_data['auto_type']  = auto_type
-    context.user_data['auto_desc']  = auto_desc
-    context.user_data['auto_link']  = auto_link
+    context.user_data['auto_title'] = auto.title
+    context.user_data['auto_type']  = auto.opp_type
+    context.user_data['auto_desc_range'] = auto.desc_range
+    context.user_data['auto_link']  = auto.link
 
     if auto_dl:
         context.user_data['deadline'] = auto_dl
@@ -227,19 +502,18 @@ async def deadline(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if text.lower() == 'yes' and context.user_data.get('deadline'):
         pass  # keep auto-detected date
     else:
-        try:
-            dl = date_parse(text, fuzzy=True)
-            if dl < datetime.now():
-                await update.message.reply_text('⚠️ That date is in the past. Please enter a future date:')
-                return DEADLINE
-            context.user_data['deadline'] = dl
-        except Exception:
+        dl = try_parse_date(text)
+        if dl is None:
             await update.message.reply_text(
                 "❌ Couldn't parse that as a date.\n"
                 "Try formats like `2026-05-01`, `Feb 20`, or `next week`.",
                 parse_mode='Markdown'
             )
             return DEADLINE
+        if dl < datetime.now():
+            await update.message.reply_text('⚠️ That date is in the past. Please enter a future date:')
+            return DEADLINE
+        context.user_data['deadline'] = dl
 
     auto_type = context.user_data['auto_type']
     keyboard = [['Internship', 'Scholarship', 'Event', 'Job', 'Other']]
@@ -272,8 +546,8 @@ async def priority(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 async def title_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     text = update.message.text.strip()
     context.user_data['title'] = context.user_data['auto_title'] if text.lower() == 'yes' else text
-    auto_desc = context.user_data['auto_desc']
-    preview = (auto_desc[:200] + '…') if len(auto_desc) > 200 else auto_desc
+    auto_desc = resolve_auto_desc(context.user_data)
+    preview = _truncate(auto_desc, 200)
     await update.message.reply_text(
         f"📄 Detected description:\n{preview}\n\nReply *yes* to confirm, or type a new description:",
         parse_mode='Markdown'
@@ -282,7 +556,7 @@ async def title_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
 
 async def description(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     text = update.message.text.strip()
-    context.user_data['description'] = context.user_data['auto_desc'] if text.lower() == 'yes' else text
+    context.user_data['description'] = resolve_auto_desc(context.user_data) if text.lower() == 'yes' else text
 
     auto_link = context.user_data.get('auto_link')
     if auto_link:
@@ -304,7 +578,7 @@ async def link_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     elif text.lower() == 'none':
         link = ''
     else:
-        if re.match(r'https?://\S+', text):
+        if _URL_RE.match(text):
             link = text
         else:
             await update.message.reply_text(
@@ -319,7 +593,7 @@ async def link_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     pri   = context.user_data['priority']
     title = context.user_data['title']
     desc  = context.user_data['description']
-    short = (desc[:100] + '…') if len(desc) > 100 else desc
+    short = _truncate(desc, 100)
     summary_text = (
         f"💾 *Save this opportunity?*\n\n"
         f"*Title:* {title}\n"
@@ -345,25 +619,28 @@ async def confirm_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         return ConversationHandler.END
 
     user_id      = query.from_user.id
-    opp_id       = str(uuid.uuid4())[:8]
     title        = context.user_data['title']
     opp_type     = context.user_data['opp_type']
     deadline     = context.user_data['deadline']
     priority     = context.user_data['priority']
     desc         = context.user_data['description']
-    message_text = context.user_data['message_text']
+    message_text = context.user_data['message_text'][:4096]  # cap stored copy at 4KB
     link         = context.user_data.get('link', '')
 
     try:
-        conn = sqlite3.connect(DB_FILE)
-        conn.execute(
-            'INSERT INTO opportunities '
-            '(opp_id, user_id, title, opp_type, deadline, priority, description, message_text, link) '
-            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
-            (opp_id, user_id, title, opp_type, deadline.isoformat(), priority, desc, message_text, link)
-        )
-        conn.commit()
-        conn.close()
+        with DB_LOCK:
+            while True:
+                opp_id = _next_opp_id()
+                try:
+                    DB_CONN.execute(
+                        _INSERT_SQL,
+                        (opp_id, user_id, title, opp_type, deadline.isoformat(), int(deadline.timestamp()),
+                         priority, desc, message_text, link)
+                    )
+                except sqlite3.IntegrityError:
+                    continue  # id taken by a legacy uuid-style row; take the next
+                break
+            DB_CONN.commit()
     except Exception as e:
         logger.error('DB error: %s', e)
         await query.edit_message_text('⚠️ Error saving. Please try again.')
@@ -371,7 +648,7 @@ async def confirm_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
     schedule_reminders(context.job_queue, user_id, opp_id, deadline, priority, title, desc, opp_type, link)
 
-    short = (desc[:100] + '…') if len(desc) > 100 else desc
+    short = _truncate(desc, 100)
     await query.edit_message_text(
         f"✅ *Opportunity Saved!*\n\n"
         f"*ID:* `{opp_id}`\n"
@@ -386,26 +663,32 @@ async def confirm_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     context.user_data.clear()
     return ConversationHandler.END
 
+# Constant template filled per send; the conditional pieces (header, link
+# line, truncated description) are computed once and slotted in.
+_REMIND_TPL = (
+    "{header}\n\n"
+    "📌 *ID:* `{opp_id}`\n"
+    "🏷️ *Title:* {title}\n"
+    "🗂️ *Type:* {opp_type}\n"
+    "📄 *Description:* {short}"
+    "{link_line}"
+)
+
 async def send_reminder(context: ContextTypes.DEFAULT_TYPE) -> None:
     d        = context.job.data
     user_id  = d['user_id']
     opp_id   = d['opp_id']
-    title    = d.get('title', '')
-    desc     = d.get('desc', '')
-    opp_type = d.get('opp_type', 'Other')
     link     = d.get('link', '')
     days     = d.get('days', 0)
+    _forget_fired_job(opp_id, context.job)
 
-    header = f"⏰ *{days} day(s) left!*" if days > 0 else "🚨 *TODAY is the deadline!*"
-    short  = (desc[:120] + '…') if len(desc) > 120 else desc
-    link_line = f"\n🔗 *Link:* {link}" if link else ''
-    msg = (
-        f"{header}\n\n"
-        f"📌 *ID:* `{opp_id}`\n"
-        f"🏷️ *Title:* {title}\n"
-        f"🗂️ *Type:* {opp_type}\n"
-        f"📄 *Description:* {short}"
-        f"{link_line}"
+    msg = _REMIND_TPL.format(
+        header=f"⏰ *{days} day(s) left!*" if days > 0 else "🚨 *TODAY is the deadline!*",
+        opp_id=opp_id,
+        title=d.get('title', ''),
+        opp_type=d.get('opp_type', 'Other'),
+        short=_truncate(d.get('desc', ''), 120),
+        link_line=f"\n🔗 *Link:* {link}" if link else '',
     )
     keyboard = InlineKeyboardMarkup([[
         InlineKeyboardButton('✅ Mark as Done', callback_data=f'done_{opp_id}')
@@ -415,57 +698,156 @@ async def send_reminder(context: ContextTypes.DEFAULT_TYPE) -> None:
     except Exception as exc:
         logger.error('Reminder send failed for %s: %s', opp_id, exc)
 
-def schedule_reminders(job_queue, user_id, opp_id, deadline, priority, title, desc='', opp_type='Other', link=''):
-    """Synchronous — safe to call from startup and from confirm_callback."""
-    now = datetime.now()
-    days_list = [14, 7, 3, 2, 1, 0] if 'High' in (priority or '') else [7, 3, 1, 0]
-    for days in days_list:
-        fire_at = deadline - timedelta(days=days)
+# Reminder schedules as immutable module constants: (days, timedelta) pairs so
+# neither the list nor the deltas are rebuilt per opportunity. The exact
+# keyboard labels route through the dict; free-typed priorities fall back to
+# the original 'High' substring check.
+_HIGH_DAYS    = tuple((d, timedelta(days=d)) for d in (14, 7, 3, 2, 1, 0))
+_DEFAULT_DAYS = tuple((d, timedelta(days=d)) for d in (7, 3, 1, 0))
+_REMINDER_DAYS = {'High 🔥': _HIGH_DAYS, 'Medium': _DEFAULT_DAYS, 'Low': _DEFAULT_DAYS}
+
+# opp_id -> [Job] so cancelling reminders is O(reminders per opp) instead of a
+# substring scan over the whole job queue (which could also false-match an
+# 8-char id appearing inside another job's name).
+_JOBS_BY_OPP = {}
+
+def schedule_reminders(job_queue, user_id, opp_id, deadline, priority, title, desc='', opp_type='Other', link='', now=None):
+    """Synchronous — safe to call from startup and from confirm_callback.
+
+    `now` can be passed in so the startup mass-reschedule doesn't re-query
+    the clock for every row."""
+    if now is None:
+        now = datetime.now()
+    days_list = _REMINDER_DAYS.get(priority)
+    if days_list is None:
+        days_list = _HIGH_DAYS if 'High' in (priority or '') else _DEFAULT_DAYS
+    jobs = _JOBS_BY_OPP.setdefault(opp_id, [])
+    for days, delta in days_list:
+        fire_at = deadline - delta
         if fire_at > now:
-            job_queue.run_once(
+            jobs.append(job_queue.run_once(
                 send_reminder,
                 when=fire_at,
                 data={'user_id': user_id, 'opp_id': opp_id, 'title': title,
                       'desc': desc, 'opp_type': opp_type, 'link': link, 'days': days},
                 name=f'rem_{opp_id}_{days}'
-            )
+            ))
+
+def cancel_reminders(opp_id):
+    """Remove every scheduled reminder for one opportunity."""
+    for job in _JOBS_BY_OPP.pop(opp_id, ()):
+        try:
+            job.schedule_removal()
+        except JobLookupError:
+            pass  # already fired; nothing left to remove
+
+def _forget_fired_job(opp_id, job):
+    """Drop a fired run-once job from the per-opp index so the map doesn't
+    hold dead handles (cancelling one raises JobLookupError) or grow forever."""
+    jobs = _JOBS_BY_OPP.get(opp_id)
+    if jobs is None:
+        return
+    try:
+        jobs.remove(job)
+    except ValueError:
+        pass
+    if not jobs:
+        _JOBS_BY_OPP.pop(opp_id, None)
+
+# Page size for the missed sweep: keeps peak memory O(batch) however large the
+# table grows, and flagged rows drop out of the query between batches.
+_MISSED_BATCH = 100
+
+def _has_missed_sync():
+    """Index-only existence probe so the usual nothing-overdue day costs one
+    row lookup instead of materialising a batch."""
+    now_ts = int(datetime.now().timestamp())
+    with DB_LOCK:
+        c = DB_CONN.execute(
+            'SELECT 1 FROM opportunities '
+            'WHERE deadline_ts < ? AND archived = 0 AND done = 0 AND missed_notified = 0 '
+            'LIMIT 1',
+            (now_ts,)
+        )
+        return c.fetchone() is not None
+
+def _check_missed_db_sync():
+    """One batch of overdue rows; runs in a worker thread off the loop."""
+    now_ts = int(datetime.now().timestamp())
+    with DB_LOCK:
+        c = DB_CONN.cursor()
+        c.execute(
+            'SELECT user_id, opp_id, title, description, opp_type, link, deadline_ts '
+            'FROM opportunities '
+            'WHERE deadline_ts < ? AND archived = 0 AND done = 0 AND missed_notified = 0 '
+            'LIMIT ?',
+            (now_ts, _MISSED_BATCH)
+        )
+        return c.fetchall()
+
+def _mark_missed_notified_sync(opp_ids):
+    # One statement for the whole batch; opp_ids is capped at _MISSED_BATCH,
+    # far below SQLite's default 32k parameter limit.
+    placeholders = ','.join('?' * len(opp_ids))
+    with DB_LOCK:
+        DB_CONN.execute(
+            f'UPDATE opportunities SET missed_notified = 1 WHERE opp_id IN ({placeholders})',
+            opp_ids
+        )
+        DB_CONN.commit()
+
+async def _notify_missed(bot, sem, row):
+    """Send one missed-opportunity message; returns the opp_id on success."""
+    opp_id = row['opp_id']
+    link   = row['link']
+    dl     = datetime.fromtimestamp(row['deadline_ts'])
+    desc_s = row['description'] or ''
+    short  = _truncate(desc_s, 100)
+    link_line = f'\n🔗 *Link:* {link}' if link else ''
+    msg = (
+        f"❌ *Missed Opportunity!*\n\n"
+        f"*ID:* `{opp_id}`\n"
+        f"*Title:* {row['title']}\n"
+        f"*Type:* {row['opp_type']}\n"
+        f"*Deadline was:* {dl.strftime('%Y-%m-%d')}\n"
+        f"*Description:* {short}"
+        f"{link_line}\n\n"
+        "Mark as done to keep your list clean. ☑️"
+    )
+    keyboard = InlineKeyboardMarkup([[
+        InlineKeyboardButton('✅ Mark as Done', callback_data=f'done_{opp_id}')
+    ]])
+    async with sem:
+        await bot.send_message(chat_id=row['user_id'], text=msg, reply_markup=keyboard, parse_mode='Markdown')
+    return opp_id
 
 async def check_missed(context: ContextTypes.DEFAULT_TYPE) -> None:
     """Fires once daily; notifies each overdue opportunity ONCE only."""
-    now = datetime.now()
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute(
-        'SELECT user_id, opp_id, title, description, opp_type, link, deadline '
-        'FROM opportunities '
-        'WHERE deadline < ? AND archived = 0 AND done = 0 AND missed_notified = 0',
-        (now.isoformat(),)
-    )
-    for uid, opp_id, title, desc, opp_type, link, dl_str in c.fetchall():
-        try:
-            dl    = datetime.fromisoformat(str(dl_str))
-            desc_s = str(desc) if desc else ''
-            short  = (desc_s[:100] + '…') if len(desc_s) > 100 else desc_s
-            link_line = f'\n🔗 *Link:* {link}' if link else ''
-            msg = (
-                f"❌ *Missed Opportunity!*\n\n"
-                f"*ID:* `{opp_id}`\n"
-                f"*Title:* {title}\n"
-                f"*Type:* {opp_type}\n"
-                f"*Deadline was:* {dl.strftime('%Y-%m-%d')}\n"
-                f"*Description:* {short}"
-                f"{link_line}\n\n"
-                "Mark as done to keep your list clean. ☑️"
-            )
-            keyboard = InlineKeyboardMarkup([[
-                InlineKeyboardButton('✅ Mark as Done', callback_data=f'done_{opp_id}')
-            ]])
-            await context.bot.send_message(chat_id=uid, text=msg, reply_markup=keyboard, parse_mode='Markdown')
-            conn.execute('UPDATE opportunities SET missed_notified = 1 WHERE opp_id = ?', (opp_id,))
-            conn.commit()
-        except Exception as exc:
-            logger.error('Missed-notify failed for %s: %s', opp_id, exc)
-    conn.close()
+    if not await asyncio.to_thread(_has_missed_sync):
+        return
+    # Concurrent sends, capped below Telegram's ~30 msg/sec global limit.
+    sem = asyncio.Semaphore(25)
+    while True:
+        rows = await asyncio.to_thread(_check_missed_db_sync)
+        if not rows:
+            return
+        results = await asyncio.gather(
+            *(_notify_missed(context.bot, sem, row) for row in rows),
+            return_exceptions=True
+        )
+        notified = []
+        for row, result in zip(rows, results):
+            if isinstance(result, Exception):
+                logger.error('Missed-notify failed for %s: %s', row['opp_id'], result)
+            else:
+                notified.append(result)
+        if not notified:
+            # Every send in this batch failed; bail out instead of re-fetching
+            # the same rows forever. They stay unflagged for the next sweep.
+            return
+        await asyncio.to_thread(_mark_missed_notified_sync, notified)
+        if len(rows) < _MISSED_BATCH:
+            return
 
 async def mark_done_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     query = update.callback_query
@@ -473,39 +855,84 @@ async def mark_done_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
     if query.data.startswith('done_'):
         opp_id = query.data.split('_')[1]
         user_id = query.from_user.id
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute('UPDATE opportunities SET done=1, archived=1 WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
-        updated = c.rowcount
-        conn.commit()
-        conn.close()
+        with DB_LOCK:
+            c = DB_CONN.execute('UPDATE opportunities SET done=1, archived=1 WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
+            updated = c.rowcount
+            DB_CONN.commit()
         if updated > 0:
-            for job in context.job_queue.jobs():
-                if job.name and opp_id in job.name:
-                    job.schedule_removal()
+            cancel_reminders(opp_id)
             await query.edit_message_text("✅ Marked as done! No more reminders.")
         else:
             await query.edit_message_text("No matching opportunity.")
     return ConversationHandler.END
 
+LIST_PAGE_SIZE = 10
+
+def build_list_page(user_id, page):
+    """Returns (text, reply_markup) for one page of /list, or (None, None) if empty."""
+    now_ts = int(datetime.now().timestamp())
+    with DB_LOCK:
+        c = DB_CONN.cursor()
+        c.execute(
+            'SELECT COUNT(*) FROM opportunities WHERE user_id = ? AND archived = 0 AND done = 0',
+            (user_id,)
+        )
+        total = c.fetchone()[0]
+        if total == 0:
+            return None, None
+        pages = (total + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE
+        page = max(1, min(page, pages))
+        # Deadline formatting and days-left land in SQL, so the Python loop
+        # never builds a datetime per row. The "% 86400 < 0" term turns
+        # SQLite's truncating division into floor division, keeping rows
+        # overdue by less than a day reported as Overdue rather than 0 days.
+        c.execute(
+            'SELECT opp_id, title, opp_type, priority, description, '
+            "date(deadline_ts, 'unixepoch', 'localtime') AS deadline_date, "
+            '(deadline_ts - :now) / 86400 - ((deadline_ts - :now) % 86400 < 0) AS days_left '
+            'FROM opportunities '
+            'WHERE user_id = :uid AND archived = 0 AND done = 0 '
+            'ORDER BY deadline_ts LIMIT :lim OFFSET :off',
+            {'now': now_ts, 'uid': user_id, 'lim': LIST_PAGE_SIZE, 'off': (page - 1) * LIST_PAGE_SIZE}
+        )
+        opps = c.fetchall()
+    parts = [f"Active Opportunities (page {page}/{pages}):\n\n"]
+    for row in opps:
+        days_left = row['days_left']
+        status = f"{days_left} days left" if days_left >= 0 else "Overdue!"
+        parts.append(f"ID: {row['opp_id']}\nTitle: {row['title']}\nType: {row['opp_type']}\nPriority: {row['priority']}\nDeadline: {row['deadline_date']}\nStatus: {status}\nDesc: {row['description'][:50]}...\n\n")
+    msg = "".join(parts)
+    reply_markup = None
+    if page < pages:
+        reply_markup = InlineKeyboardMarkup([[
+            InlineKeyboardButton('Next page ➡️', callback_data=f'list_page_{page + 1}')
+        ]])
+    return msg, reply_markup
+
 async def list_opps(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.message.from_user.id
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute('SELECT opp_id, title, opp_type, deadline, priority, description FROM opportunities WHERE user_id = ? AND archived = 0 AND done = 0 ORDER BY deadline', (user_id,))
-    opps = c.fetchall()
-    conn.close()
-    if not opps:
+    try:
+        page = int(context.args[0]) if context.args else 1
+    except ValueError:
+        page = 1
+    msg, reply_markup = build_list_page(user_id, page)
+    if msg is None:
         await update.message.reply_text("No active opportunities.")
         return
-    msg = "Active Opportunities:\n\n"
-    now = datetime.now()
-    for opp_id, title, typ, dl_str, pri, desc in opps:
-        dl = datetime.fromisoformat(dl_str)
-        days_left = (dl - now).days
-        status = f"{days_left} days left" if days_left >= 0 else "Overdue!"
-        msg += f"ID: {opp_id}\nTitle: {title}\nType: {typ}\nPriority: {pri}\nDeadline: {dl.strftime('%Y-%m-%d')}\nStatus: {status}\nDesc: {desc[:50]}...\n\n"
-    await update.message.reply_text(msg)
+    await update.message.reply_text(msg, reply_markup=reply_markup)
+
+async def list_page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    query = update.callback_query
+    await query.answer()
+    try:
+        page = int(query.data.rsplit('_', 1)[1])
+    except ValueError:
+        page = 1
+    msg, reply_markup = build_list_page(query.from_user.id, page)
+    if msg is None:
+        await query.edit_message_text("No active opportunities.")
+        return
+    await query.edit_message_text(msg, reply_markup=reply_markup)
 
 async def delete(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not context.args:
@@ -513,16 +940,12 @@ async def delete(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     opp_id = context.args[0]
     user_id = update.message.from_user.id
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute('DELETE FROM opportunities WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
-    deleted = c.rowcount
-    conn.commit()
-    conn.close()
+    with DB_LOCK:
+        c = DB_CONN.execute('DELETE FROM opportunities WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
+        deleted = c.rowcount
+        DB_CONN.commit()
     if deleted > 0:
-        for job in context.job_queue.jobs():
-            if job.name and opp_id in job.name:
-                job.schedule_removal()
+        cancel_reminders(opp_id)
         await update.message.reply_text("Deleted.")
     else:
         await update.message.reply_text("Not found.")
@@ -533,16 +956,12 @@ async def archive(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     opp_id = context.args[0]
     user_id = update.message.from_user.id
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute('UPDATE opportunities SET archived=1 WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
-    updated = c.rowcount
-    conn.commit()
-    conn.close()
+    with DB_LOCK:
+        c = DB_CONN.execute('UPDATE opportunities SET archived=1 WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
+        updated = c.rowcount
+        DB_CONN.commit()
     if updated > 0:
-        for job in context.job_queue.jobs():
-            if job.name and opp_id in job.name:
-                job.schedule_removal()
+        cancel_reminders(opp_id)
         await update.message.reply_text("Archived.")
     else:
         await update.message.reply_text("Not found.")
@@ -553,16 +972,12 @@ async def done(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     opp_id = context.args[0]
     user_id = update.message.from_user.id
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute('UPDATE opportunities SET done=1, archived=1 WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
-    updated = c.rowcount
-    conn.commit()
-    conn.close()
+    with DB_LOCK:
+        c = DB_CONN.execute('UPDATE opportunities SET done=1, archived=1 WHERE opp_id = ? AND user_id = ?', (opp_id, user_id))
+        updated = c.rowcount
+        DB_CONN.commit()
     if updated > 0:
-        for job in context.job_queue.jobs():
-            if job.name and opp_id in job.name:
-                job.schedule_removal()
+        cancel_reminders(opp_id)
         await update.message.reply_text("Marked as done! Reminders stopped.")
     else:
         await update.message.reply_text("Not found.")
@@ -571,22 +986,20 @@ async def summary(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.message.from_user.id
     now = datetime.now()
     week_end = now + timedelta(days=7)
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute(
-        'SELECT COUNT(*), opp_type FROM opportunities '
-        'WHERE user_id = ? AND deadline >= ? AND deadline <= ? AND archived=0 AND done=0 GROUP BY opp_type',
-        (user_id, now.isoformat(), week_end.isoformat())
-    )
-    sums = c.fetchall()
-    conn.close()
+    with DB_LOCK:
+        c = DB_CONN.execute(
+            'SELECT COUNT(*), opp_type FROM opportunities '
+            'WHERE user_id = ? AND deadline_ts >= ? AND deadline_ts <= ? AND archived=0 AND done=0 GROUP BY opp_type',
+            (user_id, int(now.timestamp()), int(week_end.timestamp()))
+        )
+        sums = c.fetchall()
     if not sums:
         await update.message.reply_text("No upcoming this week.")
         return
-    msg = "Upcoming this week:\n"
+    parts = ["Upcoming this week:\n"]
     for count, typ in sums:
-        msg += f"{count} {typ}(s)\n"
-    await update.message.reply_text(msg)
+        parts.append(f"{count} {typ}(s)\n")
+    await update.message.reply_text("".join(parts))
 
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
     logger.warning('Update caused error: %s', context.error)
@@ -594,30 +1007,43 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
 # --- Reschedule reminders on startup ---
 def reschedule_all_reminders(job_queue: JobQueue):
     """Re-registers all pending reminders after a bot restart."""
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute(
-        'SELECT user_id, opp_id, title, deadline, priority, description, opp_type, link '
-        'FROM opportunities WHERE archived = 0 AND done = 0'
-    )
-    rows = c.fetchall()
-    conn.close()
     now = datetime.now()
-    for user_id, opp_id, title, dl_str, priority, desc, opp_type, link in rows:
+    with DB_LOCK:
+        c = DB_CONN.execute(
+            'SELECT user_id, opp_id, title, deadline_ts, priority, description, opp_type, link '
+            'FROM opportunities WHERE archived = 0 AND done = 0 AND deadline_ts > ?',
+            (int(now.timestamp()),)
+        )
+        rows = c.fetchall()
+    for row in rows:
+        dl_ts = row['deadline_ts']
         try:
-            deadline = datetime.fromisoformat(dl_str)
-            if deadline > now:
-                schedule_reminders(
-                    job_queue, user_id, opp_id, deadline,
-                    priority or '', title or '', desc or '', opp_type or 'Other', link or ''
-                )
+            schedule_reminders(
+                job_queue, row['user_id'], row['opp_id'], datetime.fromtimestamp(dl_ts),
+                row['priority'] or '', row['title'] or '', row['description'] or '',
+                row['opp_type'] or 'Other', row['link'] or '',
+                now=now
+            )
         except Exception as exc:
-            logger.error('Startup reschedule failed for %s: %s', opp_id, exc)
+            logger.error('Startup reschedule failed for %s: %s', row['opp_id'], exc)
 
 # --- Main ---
 def main():
     application = Application.builder().token(BOT_TOKEN).job_queue(JobQueue()).build()
-    reschedule_all_reminders(application.job_queue)
+    # Bulk-inserting 6 jobs per opportunity one by one wakes the scheduler
+    # (and takes its lock) each time once it is running. Here the scheduler
+    # has not started yet — run_polling starts it — so the inserts are already
+    # batched; the pause/resume guard keeps that true if startup order ever
+    # changes.
+    scheduler = application.job_queue.scheduler
+    if scheduler.running:
+        scheduler.pause()
+        try:
+            reschedule_all_reminders(application.job_queue)
+        finally:
+            scheduler.resume()
+    else:
+        reschedule_all_reminders(application.job_queue)
     if 'missed_job' not in application.bot_data:
         application.job_queue.run_repeating(
             check_missed,
@@ -644,6 +1070,7 @@ def main():
 
     application.add_handler(conv_handler)
     application.add_handler(CallbackQueryHandler(mark_done_callback, pattern='^done_'))
+    application.add_handler(CallbackQueryHandler(list_page_callback, pattern='^list_page_'))
     application.add_handler(CommandHandler('start',   start))
     application.add_handler(CommandHandler('list',    list_opps))
     application.add_handler(CommandHandler('delete',  delete))